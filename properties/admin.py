@@ -1,8 +1,55 @@
 # properties/admin.py
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import (
+    BooleanField, Case, DecimalField, ExpressionWrapper, F, Q, When,
+)
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 from .models import Property
 
+# Hoisted out of status_display so the changelist doesn't rebuild them per row
+_STATUS_COLOR_MAP = {
+    'available': 'green',
+    'sold': 'red',
+    'pending': 'orange',
+    'rented': 'blue',
+}
+_STATUS_TEMPLATE = '<span style="color: {}; font-weight: bold;">{}</span>'
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that avoids the unfiltered SELECT COUNT(*) on large tables.
+
+    When the changelist has no filters applied, return the row estimate
+    PostgreSQL keeps in pg_class.reltuples instead of scanning the table.
+    Filtered querysets still get an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+
+        # Only estimate for a plain, unfiltered queryset on PostgreSQL.
+        if (query is not None and not query.where
+                and connection.vendor == 'postgresql'):
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                        [query.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row is not None and row[0] >= 0:
+                    return int(row[0])
+            except Exception:
+                pass  # Fall through to the exact count
+
+        return super().count
+
+
 @admin.register(Property)
 class PropertyAdmin(admin.ModelAdmin):
     list_display = [
@@ -13,7 +60,7 @@ class PropertyAdmin(admin.ModelAdmin):
         'property_type',
         'status_display',
         'created_at_short',
-        'is_available'
+        'is_available_display'
     ]
     
     list_filter = [
@@ -32,7 +79,18 @@ class PropertyAdmin(admin.ModelAdmin):
         'location',
         'reference_number',
     ]
-    
+
+    # No FK columns on the changelist today; keep this explicit so a future
+    # relation doesn't silently reintroduce per-row queries.
+    list_select_related = []
+
+    # Skip the extra unfiltered SELECT COUNT(*) admin runs next to the
+    # paginated count on every changelist load.
+    show_full_result_count = False
+
+    # Estimated count from pg_class when no filters are applied.
+    paginator = FasterAdminPaginator
+
     readonly_fields = [
         'reference_number',
         'created_at',
@@ -48,7 +106,7 @@ class PropertyAdmin(admin.ModelAdmin):
             'fields': ('price', 'location')
         }),
         ('Property Details', {
-            'fields': ('property_type', 'bedrooms', 'bathrooms', 'square_feet')
+            'fields': ('property_type', 'bedrooms', 'bathrooms_halves', 'square_feet')
         }),
         ('Features', {
             'fields': ('has_garage', 'has_pool', 'has_garden', 'is_furnished'),
@@ -63,6 +121,24 @@ class PropertyAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """
+        Skip the large description TextField on list pages and compute
+        is_available / price_per_sqft in the database instead of per-row
+        Python properties.
+        """
+        return super().get_queryset(request).defer('description').annotate(
+            db_is_available=ExpressionWrapper(
+                Q(status='available'),
+                output_field=BooleanField(),
+            ),
+            db_price_per_sqft=Case(
+                When(square_feet__gt=0, then=F('price') / F('square_feet')),
+                default=None,
+                output_field=DecimalField(max_digits=10, decimal_places=2),
+            ),
+        )
+
     def price_display(self, obj):
         """Display price with dollar sign"""
         return f"${obj.price:,.2f}"
@@ -71,20 +147,20 @@ class PropertyAdmin(admin.ModelAdmin):
     
     def status_display(self, obj):
         """Color-coded status display"""
-        color_map = {
-            'available': 'green',
-            'sold': 'red',
-            'pending': 'orange',
-            'rented': 'blue',
-        }
-        color = color_map.get(obj.status, 'black')
         return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
+            _STATUS_TEMPLATE,
+            _STATUS_COLOR_MAP.get(obj.status, 'black'),
             obj.get_status_display()
         )
     status_display.short_description = 'Status'
     
+    def is_available_display(self, obj):
+        """Availability computed by the changelist annotation"""
+        return obj.db_is_available
+    is_available_display.short_description = 'Available'
+    is_available_display.boolean = True
+    is_available_display.admin_order_field = 'db_is_available'
+
     def created_at_short(self, obj):
         """Display short date format"""
         return obj.created_at.strftime('%Y-%m-%d')
@@ -93,7 +169,8 @@ class PropertyAdmin(admin.ModelAdmin):
     
     def price_per_sqft_display(self, obj):
         """Display price per square foot if available"""
-        price_per_sqft = obj.price_per_sqft
+        # Prefer the DB annotation; fall back to the model property
+        price_per_sqft = getattr(obj, 'db_price_per_sqft', None) or obj.price_per_sqft
         if price_per_sqft:
             return f"${price_per_sqft:,.2f}/sqft"
         return "N/A"
@@ -1,28 +1,62 @@
+import logging
+import os
+import sys
+import threading
+
 from django.apps import AppConfig
 
+# Process entry points that actually serve requests; anything else
+# (manage.py commands, shells, one-off scripts) must not warm the cache
+_SERVER_BINARIES = ('gunicorn', 'uwsgi', 'daphne', 'uvicorn', 'mod_wsgi')
+
+
+def _serving_requests():
+    """
+    Whether this process will serve HTTP requests.
+
+    Under runserver only the autoreloader child (RUN_MAIN set to
+    'true') serves; the watcher parent leaves RUN_MAIN unset, so it
+    must not be defaulted to true. Everything launched through
+    manage.py other than runserver is a management command. Outside
+    manage.py, go by the entry-point binary: real app servers warm,
+    bare django.setup() scripts don't.
+    """
+    argv0 = os.path.basename(sys.argv[0] or '')
+    if argv0 == 'manage.py' or argv0.endswith('/manage.py'):
+        return (
+            len(sys.argv) > 1
+            and sys.argv[1] == 'runserver'
+            and os.environ.get('RUN_MAIN') == 'true'
+        )
+    return any(binary in argv0 for binary in _SERVER_BINARIES)
+
+
 class PropertiesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'properties'
-    
+
     def ready(self):
         """
         Override ready() method to import signals when app is ready.
         This ensures signals are connected when Django starts.
         """
         # Import signals module
-        import properties.signals
-        
-        # You can also connect custom signals here if needed
-        self._setup_custom_signals()
-        
-        # Log that signals are loaded
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("✅ Properties app signals loaded successfully")
-    
-    def _setup_custom_signals(self):
-        """
-        Setup any custom signals for the properties app.
-        This is optional but can be useful for custom signal handling.
-        """
-        pass
+        import properties.signals  # noqa: F401
+
+        # Pre-populate hot cache keys in the background so the first
+        # requests after a deploy don't all pay the cold-miss cascade —
+        # but only in processes that will actually serve requests
+        if _serving_requests():
+            threading.Thread(target=self._warm_cache, daemon=True).start()
+
+    @staticmethod
+    def _warm_cache():
+        from .utils import PropertyCacheManager
+
+        try:
+            PropertyCacheManager.warm_cache()
+        except Exception:
+            # Warm-up is best effort; boot must not depend on DB/Redis
+            logging.getLogger(__name__).warning(
+                "Property cache warm-up failed", exc_info=True
+            )
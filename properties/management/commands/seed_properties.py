@@ -1,5 +1,6 @@
 # properties/management/commands/seed_properties.py
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from properties.models import Property
 from decimal import Decimal
 from faker import Faker
@@ -28,35 +29,59 @@ class Command(BaseCommand):
         ]
         
         self.stdout.write(f"Creating {count} sample properties...")
-        
+
+        # Pre-sample all random fields in bulk instead of calling
+        # random.choice/randrange once per field per iteration.
+        title_suffixes = random.choices(['House', 'Apartment', 'Villa', 'Condo'], k=count)
+        prices = [Decimal(p) for p in random.choices(range(100000, 1000000, 50000), k=count)]
+        location_choices = random.choices(locations, k=count)
+        type_choices = random.choices(property_types, k=count)
+        bedroom_counts = random.choices(range(1, 6), k=count)
+        bathroom_counts = [Decimal(b) / 10 for b in random.choices(range(10, 35), k=count)]  # 1.0 to 3.4
+        sqft_values = random.choices(range(800, 4000, 100), k=count)
+        feature_flags = [
+            (bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8))
+            for bits in (random.getrandbits(4) for _ in range(count))
+        ]
+        statuses = random.choices(
+            ['available', 'sold', 'pending'], weights=[3, 1, 1], k=count
+        )
+
+        batch_size = 500
         properties_created = 0
-        for i in range(count):
-            try:
-                property_data = {
-                    'title': f"{fake.word().title()} {random.choice(['House', 'Apartment', 'Villa', 'Condo'])}",
-                    'description': fake.text(max_nb_chars=200),
-                    'price': Decimal(random.randrange(100000, 1000000, 50000)),
-                    'location': random.choice(locations),
-                    'property_type': random.choice(property_types),
-                    'bedrooms': random.randint(1, 5),
-                    'bathrooms': Decimal(random.randrange(10, 35)) / 10,  # 1.0 to 3.5
-                    'square_feet': random.randrange(800, 4000, 100),
-                    'has_garage': random.choice([True, False]),
-                    'has_pool': random.choice([True, False]),
-                    'has_garden': random.choice([True, False]),
-                    'is_furnished': random.choice([True, False]),
-                    'status': random.choice(['available', 'available', 'available', 'sold', 'pending']),
-                }
-                
-                Property.objects.create(**property_data)
-                properties_created += 1
-                
-                if properties_created % 10 == 0:
+        batch = []
+
+        with transaction.atomic():
+            for i in range(count):
+                has_garage, has_pool, has_garden, is_furnished = feature_flags[i]
+                property_obj = Property(
+                    title=f"{fake.word().title()} {title_suffixes[i]}",
+                    description=fake.text(max_nb_chars=200),
+                    price=prices[i],
+                    location=location_choices[i],
+                    property_type=type_choices[i],
+                    bedrooms=bedroom_counts[i],
+                    bathrooms=bathroom_counts[i],
+                    square_feet=sqft_values[i],
+                    has_garage=has_garage,
+                    has_pool=has_pool,
+                    has_garden=has_garden,
+                    is_furnished=is_furnished,
+                    status=statuses[i],
+                )
+                # reference_number is filled by the prop_ref_seq DB trigger
+                batch.append(property_obj)
+
+                if len(batch) >= batch_size:
+                    Property.bulk_create_with_cache_invalidation(batch, batch_size=batch_size)
+                    properties_created += len(batch)
+                    batch = []
                     self.stdout.write(f"Created {properties_created} properties...")
-                    
-            except Exception as e:
-                self.stderr.write(f"Error creating property: {e}")
-        
+
+            if batch:
+                Property.bulk_create_with_cache_invalidation(batch, batch_size=batch_size)
+                properties_created += len(batch)
+
         self.stdout.write(
             self.style.SUCCESS(f"Successfully created {properties_created} properties!")
         )
@@ -1,10 +1,14 @@
 # properties/management/commands/test_signals.py
 from django.core.management.base import BaseCommand
-from django.core.cache import cache
 from properties.models import Property
+from properties.signals import (
+    clear_all_property_cache,
+    invalidate_bulk_write_caches,
+    property_in_index,
+)
 from properties.utils import get_all_properties
 from decimal import Decimal
-import time
+from django.db import transaction
 
 class Command(BaseCommand):
     help = 'Test cache invalidation signals'
@@ -35,8 +39,8 @@ class Command(BaseCommand):
         self.stdout.write("=" * 60)
         
         # Clear cache
-        cache.delete('all_properties')
-        
+        invalidate_bulk_write_caches()
+
         # Test 1: Cache population
         self.stdout.write("\n1. Populating cache...")
         properties = get_all_properties()
@@ -44,44 +48,44 @@ class Command(BaseCommand):
         
         # Test 2: Create property
         self.stdout.write("\n2. Creating test property...")
-        test_prop = Property.objects.create(
-            title="Signal Test Property",
-            description="Testing cache invalidation",
-            price=Decimal('350000'),
-            location="Testville",
-            property_type="house",
-        )
+        # on_commit hooks run as the atomic block exits, so the cache
+        # state can be checked immediately afterwards - no sleeps needed
+        with transaction.atomic():
+            test_prop = Property.objects.create(
+                title="Signal Test Property",
+                description="Testing cache invalidation",
+                price=Decimal('350000'),
+                location="Testville",
+                property_type="house",
+            )
         self.stdout.write(f"   Created: {test_prop.title}")
         
-        time.sleep(0.5)
-        
-        # Check cache
-        cached = cache.get('all_properties')
-        self.stdout.write(f"   Cache after create: {'INVALIDATED' if cached is None else 'STILL CACHED'}")
-        
-        if cached is None:
-            self.stdout.write(self.style.SUCCESS("   ✅ Signal worked - cache invalidated"))
+        # The list cache is write-through: the signal writes the new
+        # row into the hash store instead of dropping it
+        indexed = property_in_index(test_prop.id)
+        self.stdout.write(f"   New property in cache index: {indexed}")
+
+        if indexed:
+            self.stdout.write(self.style.SUCCESS("   ✅ Signal worked - row written through to cache"))
         else:
             self.stdout.write(self.style.WARNING("   ⚠️  Signal may not have worked"))
         
         # Test 3: Update property
         self.stdout.write("\n3. Updating property...")
-        test_prop.title = "Signal Test Property - UPDATED"
-        test_prop.save()
-        
-        time.sleep(0.5)
+        with transaction.atomic():
+            test_prop.title = "Signal Test Property - UPDATED"
+            test_prop.save()
         
-        cached = cache.get('all_properties')
-        self.stdout.write(f"   Cache after update: {'INVALIDATED' if cached is None else 'STILL CACHED'}")
+        self.stdout.write(f"   Updated property still in cache index: {property_in_index(test_prop.id)}")
         
         # Test 4: Delete property
         self.stdout.write("\n4. Deleting property...")
-        test_prop.delete()
-        
-        time.sleep(0.5)
-        
-        cached = cache.get('all_properties')
-        self.stdout.write(f"   Cache after delete: {'INVALIDATED' if cached is None else 'STILL CACHED'}")
+        deleted_pk = test_prop.pk
+        with transaction.atomic():
+            test_prop.delete()
+
+        removed = not property_in_index(deleted_pk)
+        self.stdout.write(f"   Deleted property removed from cache index: {removed}")
         
         # Cleanup
         Property.objects.filter(title__contains="Signal Test").delete()
@@ -107,7 +111,7 @@ class Command(BaseCommand):
         
         self.stdout.write(f"\nCurrent Cache State:")
         self.stdout.write(f"  all_properties cached: {stats['current_cache_state']['all_properties_cached']}")
-        self.stdout.write(f"  TTL remaining: {stats['current_cache_state']['all_properties_ttl'] or 'N/A'} seconds")
+        self.stdout.write(f"  indexed properties: {stats['current_cache_state']['indexed_properties']}")
     
     def _clear_all(self):
         """Clear all test data"""
@@ -116,6 +120,6 @@ class Command(BaseCommand):
         self.stdout.write(f"Deleted {deleted} test properties")
         
         # Clear cache
-        cache.delete('all_properties')
-        self.stdout.write("Cleared cache")
+        cleared = clear_all_property_cache()
+        self.stdout.write(f"Cleared {cleared} cache entries")
         
\ No newline at end of file
@@ -0,0 +1,102 @@
+# properties/metrics_bg.py
+"""
+Background refresh for the cache-metrics dashboard data.
+
+Every dashboard request used to run get_redis_cache_metrics(),
+get_cache_metrics_trend() and get_detailed_cache_analysis() inline —
+Redis INFO calls plus history reads — under @never_cache, so the
+monitoring views themselves hammered the system they monitor. A single
+daemon thread now recomputes the snapshot every REFRESH_INTERVAL
+seconds and the views just read the in-process dict, making request
+cost a lookup and INFO traffic independent of dashboard traffic.
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = 30  # seconds between snapshot recomputes
+
+_snapshot = {}
+_snapshot_lock = threading.Lock()
+_refresher_started = False
+_start_lock = threading.Lock()
+
+
+def _collect():
+    """Compute a fresh snapshot of all dashboard sections."""
+    from .utils import (
+        get_redis_cache_metrics,
+        get_cache_metrics_trend,
+        get_detailed_cache_analysis,
+    )
+
+    # Collect each section once and feed the analysis from it; letting
+    # the analysis re-run the collectors doubled the INFO traffic and
+    # appended two history entries per cycle, halving the 1440-entry
+    # (~24h) trend window
+    metrics = get_redis_cache_metrics()
+    trend = get_cache_metrics_trend()
+
+    return {
+        'metrics': metrics,
+        'trend': trend,
+        'analysis': get_detailed_cache_analysis(metrics=metrics, trend=trend),
+        'refreshed_at': time.time(),
+    }
+
+
+def _refresh_loop():
+    global _snapshot
+
+    while True:
+        try:
+            snapshot = _collect()
+            with _snapshot_lock:
+                _snapshot = snapshot
+        except Exception:
+            # Keep serving the previous snapshot; try again next cycle
+            logger.warning("Cache metrics refresh failed", exc_info=True)
+        time.sleep(REFRESH_INTERVAL)
+
+
+def _ensure_refresher():
+    """Start the refresher thread on first use (not at boot: the
+    dashboards may never be hit in a given process)."""
+    global _refresher_started
+
+    if _refresher_started:
+        return
+    with _start_lock:
+        if _refresher_started:
+            return
+        threading.Thread(target=_refresh_loop, daemon=True).start()
+        _refresher_started = True
+
+
+def load_cache_metrics():
+    """
+    Return the latest metrics snapshot.
+
+    The first call in a process computes synchronously (the refresher
+    has not completed a cycle yet); every later call is a dict read.
+
+    Returns:
+        dict: Snapshot with 'metrics', 'trend', 'analysis' and
+            'refreshed_at' keys
+    """
+    global _snapshot
+
+    _ensure_refresher()
+
+    with _snapshot_lock:
+        snapshot = _snapshot
+
+    if not snapshot:
+        snapshot = _collect()
+        with _snapshot_lock:
+            if not _snapshot:
+                _snapshot = snapshot
+
+    return snapshot
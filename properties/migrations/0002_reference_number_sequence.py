@@ -0,0 +1,40 @@
+# Generate reference_number from a Postgres sequence instead of Python uuid4.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+                CREATE SEQUENCE IF NOT EXISTS prop_ref_seq;
+
+                CREATE OR REPLACE FUNCTION set_property_reference_number()
+                RETURNS trigger AS $$
+                BEGIN
+                    IF NEW.reference_number IS NULL OR NEW.reference_number = '' THEN
+                        NEW.reference_number :=
+                            'PROP-' || lpad(to_hex(nextval('prop_ref_seq')), 8, '0');
+                    END IF;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER property_reference_number_trigger
+                BEFORE INSERT ON properties_property
+                FOR EACH ROW
+                EXECUTE FUNCTION set_property_reference_number();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS property_reference_number_trigger
+                    ON properties_property;
+                DROP FUNCTION IF EXISTS set_property_reference_number();
+                DROP SEQUENCE IF EXISTS prop_ref_seq;
+            """,
+        ),
+    ]
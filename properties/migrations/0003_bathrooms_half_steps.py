@@ -0,0 +1,197 @@
+# Store bathrooms as smallint half-bath steps instead of numeric(3,1),
+# and reconcile the recorded migration state with the live model.
+#
+# The recorded state (0001) only covers id/title/description/price/
+# location/created_at, so existing databases were created outside the
+# migration chain. SeparateDatabaseAndState lets one migration serve
+# both worlds: the state operations are exactly what makemigrations
+# autogenerates for the drift (so no colliding AddField appears later),
+# while the database operations use IF (NOT) EXISTS guards so they
+# complete on a fresh database built from 0001 as well as on a drifted
+# database that already has most columns.
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_reference_number_sequence'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterModelOptions(
+                    name='property',
+                    options={'ordering': ['-created_at'], 'verbose_name_plural': 'Properties'},
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='bathrooms_halves',
+                    field=models.PositiveSmallIntegerField(default=2, help_text='Bathroom count in half-bath steps (3 == 1.5 bathrooms)'),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='bedrooms',
+                    field=models.PositiveIntegerField(default=1),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='has_garage',
+                    field=models.BooleanField(default=False),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='has_garden',
+                    field=models.BooleanField(default=False),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='has_pool',
+                    field=models.BooleanField(default=False),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='is_furnished',
+                    field=models.BooleanField(default=False),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='listed_date',
+                    field=models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='property_type',
+                    field=models.CharField(choices=[('house', 'House'), ('apartment', 'Apartment'), ('condo', 'Condominium'), ('townhouse', 'Townhouse'), ('villa', 'Villa'), ('cottage', 'Cottage')], default='house', max_length=20),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='reference_number',
+                    field=models.CharField(default=None, editable=False, max_length=20, unique=True),
+                    preserve_default=False,
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='square_feet',
+                    field=models.PositiveIntegerField(blank=True, help_text='Total square footage', null=True),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='status',
+                    field=models.CharField(choices=[('available', 'Available'), ('sold', 'Sold'), ('pending', 'Pending'), ('rented', 'Rented')], default='available', max_length=20),
+                ),
+                migrations.AddField(
+                    model_name='property',
+                    name='updated_at',
+                    field=models.DateTimeField(auto_now=True),
+                ),
+                migrations.AlterField(
+                    model_name='property',
+                    name='price',
+                    field=models.DecimalField(decimal_places=2, help_text='Price in USD', max_digits=10),
+                ),
+                migrations.AddIndex(
+                    model_name='property',
+                    index=models.Index(fields=['price'], name='properties__price_32e7c2_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='property',
+                    index=models.Index(fields=['location'], name='properties__locatio_2b40b0_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='property',
+                    index=models.Index(fields=['property_type'], name='properties__propert_5c7790_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='property',
+                    index=models.Index(fields=['status', '-created_at'], name='prop_status_created_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='property',
+                    index=models.Index(condition=models.Q(('status', 'available')), fields=['-created_at'], name='prop_available_idx'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                        ALTER TABLE properties_property
+                            ADD COLUMN IF NOT EXISTS property_type varchar(20) NOT NULL DEFAULT 'house',
+                            ADD COLUMN IF NOT EXISTS bedrooms integer NOT NULL DEFAULT 1,
+                            ADD COLUMN IF NOT EXISTS square_feet integer NULL,
+                            ADD COLUMN IF NOT EXISTS status varchar(20) NOT NULL DEFAULT 'available',
+                            ADD COLUMN IF NOT EXISTS has_garage boolean NOT NULL DEFAULT false,
+                            ADD COLUMN IF NOT EXISTS has_pool boolean NOT NULL DEFAULT false,
+                            ADD COLUMN IF NOT EXISTS has_garden boolean NOT NULL DEFAULT false,
+                            ADD COLUMN IF NOT EXISTS is_furnished boolean NOT NULL DEFAULT false,
+                            ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now(),
+                            ADD COLUMN IF NOT EXISTS listed_date timestamptz NOT NULL DEFAULT now(),
+                            ADD COLUMN IF NOT EXISTS reference_number varchar(20) NOT NULL DEFAULT '',
+                            ADD COLUMN IF NOT EXISTS bathrooms_halves smallint NOT NULL DEFAULT 2;
+
+                        -- Enforce reference_number uniqueness unless a
+                        -- drifted database already carries a unique
+                        -- index under Django's generated name
+                        DO $$
+                        BEGIN
+                            IF NOT EXISTS (
+                                SELECT 1 FROM pg_indexes
+                                WHERE tablename = 'properties_property'
+                                  AND indexdef LIKE '%(reference_number)%'
+                            ) THEN
+                                CREATE UNIQUE INDEX properties_property_reference_number_uniq
+                                    ON properties_property (reference_number);
+                            END IF;
+                        END $$;
+
+                        -- Copy the old numeric bathrooms into half-bath
+                        -- steps, but only where the column exists (it
+                        -- never does on a fresh database)
+                        DO $$
+                        BEGIN
+                            IF EXISTS (
+                                SELECT 1 FROM information_schema.columns
+                                WHERE table_name = 'properties_property'
+                                  AND column_name = 'bathrooms'
+                            ) THEN
+                                UPDATE properties_property
+                                    SET bathrooms_halves = (bathrooms * 2)::smallint;
+                                ALTER TABLE properties_property DROP COLUMN bathrooms;
+                            END IF;
+                        END $$;
+
+                        CREATE INDEX IF NOT EXISTS "properties__price_32e7c2_idx"
+                            ON properties_property (price);
+                        CREATE INDEX IF NOT EXISTS "properties__locatio_2b40b0_idx"
+                            ON properties_property (location);
+                        CREATE INDEX IF NOT EXISTS "properties__propert_5c7790_idx"
+                            ON properties_property (property_type);
+                        CREATE INDEX IF NOT EXISTS "prop_status_created_idx"
+                            ON properties_property (status, created_at DESC);
+                        CREATE INDEX IF NOT EXISTS "prop_available_idx"
+                            ON properties_property (created_at DESC)
+                            WHERE status = 'available';
+                    """,
+                    reverse_sql="""
+                        ALTER TABLE properties_property
+                            ADD COLUMN IF NOT EXISTS bathrooms numeric(3, 1) NOT NULL DEFAULT 1.0;
+                        UPDATE properties_property
+                            SET bathrooms = bathrooms_halves / 2.0;
+                        ALTER TABLE properties_property DROP COLUMN IF EXISTS bathrooms_halves;
+
+                        -- Columns that predate this migration on drifted
+                        -- databases are left in place on reverse; only
+                        -- the artifacts this migration introduced go
+                        DROP INDEX IF EXISTS "properties__price_32e7c2_idx";
+                        DROP INDEX IF EXISTS "properties__locatio_2b40b0_idx";
+                        DROP INDEX IF EXISTS "properties__propert_5c7790_idx";
+                        DROP INDEX IF EXISTS "prop_status_created_idx";
+                        DROP INDEX IF EXISTS "prop_available_idx";
+                        DROP INDEX IF EXISTS properties_property_reference_number_uniq;
+                    """,
+                ),
+            ],
+        ),
+    ]
@@ -1,13 +1,315 @@
 # properties/signals.py
-from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 from django.db import transaction
 import logging
+from django_redis import get_redis_connection
 from .models import Property
 
 logger = logging.getLogger(__name__)
 
+# Redis SET holding every property-related cache key, so invalidation is
+# O(tagged keys) instead of an O(keyspace) SCAN.
+PROPERTY_TAG_KEY = 'tag:properties'
+
+# Cached total-row counter, kept current by the save/delete receivers so
+# views never pay a full-table COUNT(*) per request. Deliberately not in
+# the tag set: invalidation events must not wipe it.
+PROPERTY_COUNT_KEY = 'properties:count'
+
+
+def _adjust_property_count(delta):
+    """
+    Apply a write's effect to the cached property counter.
+
+    INCR/DECR is O(1); if the key is missing or expired the next
+    get_total_properties() call recomputes it from the database.
+    """
+    try:
+        if delta >= 0:
+            cache.incr(PROPERTY_COUNT_KEY, delta)
+        else:
+            cache.decr(PROPERTY_COUNT_KEY, -delta)
+    except ValueError:
+        # Counter not in cache; leave it for the lazy recompute
+        pass
+
+
+def tag_property_cache_key(key):
+    """
+    Register a cache key in the property tag set.
+
+    Call this alongside any cache.set of property data so the signal
+    handlers can invalidate it without scanning the keyspace.
+
+    Args:
+        key: Un-prefixed cache key that was just written
+    """
+    try:
+        conn = get_redis_connection('default')
+        conn.sadd(cache.make_key(PROPERTY_TAG_KEY), cache.make_key(key))
+    except NotImplementedError:
+        # Non-Redis backend; pattern fallback in _clear_property_cache
+        pass
+    except Exception:
+        # Tagging rides along read paths that degrade when Redis is
+        # down (IGNORE_EXCEPTIONS); an untagged key must not 500 them
+        logger.debug("Cache key tagging failed", exc_info=True)
+
+
+def _unlink_tagged_keys(keys=(), counter_key=None):
+    """
+    Unlink every cache key registered in the property tag set.
+
+    Reads the set with SMEMBERS and queues UNLINK for each member, any
+    extra exact keys, and the tag set itself in a single pipeline.
+
+    Args:
+        keys: Iterable of un-prefixed exact cache keys to unlink as well
+        counter_key: Optional un-prefixed key to INCR atomically in the
+            same pipeline
+
+    Returns:
+        list: The raw Redis keys that were unlinked
+    """
+    conn = get_redis_connection('default')
+    tag_key = cache.make_key(PROPERTY_TAG_KEY)
+    deleted_keys = list(conn.smembers(tag_key))
+    deleted_keys.extend(cache.make_key(key) for key in keys)
+
+    pipe = conn.pipeline()
+    pipe.unlink(tag_key, *deleted_keys)
+    if counter_key is not None:
+        pipe.incr(cache.make_key(counter_key))
+    pipe.execute()
+
+    return deleted_keys
+
+
+# Global version stamp folded into list-level cache keys. A write only
+# INCRs it; readers then build keys no writer has ever populated, and
+# the orphaned old-version entries simply age out via their TTL. This
+# keeps the write path at one atomic op however many list keys exist.
+PROPERTY_VERSION_KEY = 'properties:version'
+
+
+def get_properties_version():
+    """Current list-key version; initializes to 1 on first use."""
+    try:
+        return int(cache.get_or_set(PROPERTY_VERSION_KEY, 1, timeout=None))
+    except Exception:
+        return 1
+
+
+def _bump_properties_version():
+    """Advance the list-key version, making every old list key stale."""
+    try:
+        cache.incr(PROPERTY_VERSION_KEY)
+    except ValueError:
+        # Version key missing (flushed); readers default back to 1
+        cache.set(PROPERTY_VERSION_KEY, 1, timeout=None)
+
+
+# Sorted set indexing every cached property hash, scored by
+# -created_at so ZRANGE walks newest-first.
+PROPERTY_INDEX_KEY = 'properties:by_created'
+
+
+def property_hash_key(pk):
+    """Redis hash holding one property's cached list fields."""
+    return f'property:{pk}'
+
+
+def _property_hash_fields(instance):
+    """
+    Hash field mapping for one property (scalar values only).
+
+    Carries the full list projection (views.PROPERTY_LIST_FIELDS) so
+    the list entry can be rebuilt from the hash store without a DB hit.
+    """
+    return {
+        'id': instance.pk,
+        'title': instance.title,
+        'description': instance.description,
+        'price': str(instance.price),
+        'location': instance.location,
+        'property_type': instance.property_type,
+        'bedrooms': instance.bedrooms,
+        'bathrooms_halves': instance.bathrooms_halves,
+        'status': instance.status,
+        'created_at': instance.created_at.isoformat(),
+    }
+
+
+def _write_through_property(instance):
+    """
+    Update one property's hash and its index entry after a write.
+
+    Unlike the old single-blob design, a write touches O(1) keys: the
+    hash for the changed row and one ZADD — no global list to blow away
+    and refetch.
+    """
+    try:
+        conn = get_redis_connection('default')
+        pipe = conn.pipeline()
+        pipe.hset(
+            cache.make_key(property_hash_key(instance.pk)),
+            mapping=_property_hash_fields(instance),
+        )
+        pipe.zadd(
+            cache.make_key(PROPERTY_INDEX_KEY),
+            {str(instance.pk): -instance.created_at.timestamp()},
+        )
+        pipe.execute()
+    except Exception:
+        # The hash store is rebuilt from the DB on the next cold read
+        logger.debug("Property hash write-through failed", exc_info=True)
+
+
+def _remove_property_hash(pk):
+    """Drop one property's hash and index entry after a delete."""
+    try:
+        conn = get_redis_connection('default')
+        pipe = conn.pipeline()
+        pipe.unlink(cache.make_key(property_hash_key(pk)))
+        pipe.zrem(cache.make_key(PROPERTY_INDEX_KEY), str(pk))
+        pipe.execute()
+    except Exception:
+        logger.debug("Property hash removal failed", exc_info=True)
+
+
+def property_index_size():
+    """Number of properties currently in the hash-store index."""
+    try:
+        conn = get_redis_connection('default')
+        return conn.zcard(cache.make_key(PROPERTY_INDEX_KEY))
+    except Exception:
+        return 0
+
+
+def property_in_index(pk):
+    """Whether one property has an entry in the hash-store index."""
+    try:
+        conn = get_redis_connection('default')
+        return conn.zscore(cache.make_key(PROPERTY_INDEX_KEY), str(pk)) is not None
+    except Exception:
+        return False
+
+
+def invalidate_bulk_write_caches():
+    """
+    Invalidate after a bulk write that bypassed the per-row signals.
+
+    bulk_create does not fire post_save, so none of the per-row
+    maintenance ran. Drop the hash-store index so the next reader
+    rebuilds every hash from the database, bump the list version so
+    materialized list keys go stale, clear the cached row counter, and
+    unlink the tagged ad-hoc keys.
+    """
+    try:
+        _unlink_tagged_keys(
+            keys=[PROPERTY_INDEX_KEY, PROPERTY_COUNT_KEY],
+            counter_key='cache_invalidation_count',
+        )
+    except Exception:
+        logger.warning("Bulk cache invalidation fell back to cache.delete",
+                       exc_info=True)
+        cache.delete(PROPERTY_COUNT_KEY)
+    _bump_properties_version()
+
+
+def property_version_key(pk):
+    """Cache key holding the monotonic version for one property."""
+    return f'property_ver:{pk}'
+
+
+def _bump_property_version(pk):
+    """
+    Increment a property's cache version.
+
+    Readers build versioned keys like property_{pk}_v{ver}, so one INCR
+    makes every stale per-object entry unreachable; the orphans simply
+    expire via their TTL.
+    """
+    try:
+        conn = get_redis_connection('default')
+        conn.incr(cache.make_key(property_version_key(pk)))
+    except NotImplementedError:
+        cache.delete(property_version_key(pk))
+
+
+def _schedule_cache_invalidation(instance, **clear_kwargs):
+    """
+    Schedule a single cache invalidation for the current transaction.
+
+    The first save/delete in a transaction registers an on_commit hook;
+    subsequent ones are no-ops until that hook has run. Dedup works by
+    scanning the connection's pending on_commit queue for our marked
+    hook rather than a thread-local flag: Django clears the queue on
+    both commit and rollback, so a rolled-back transaction can never
+    leave a stale "already scheduled" state behind on a long-lived
+    worker thread.
+
+    Args:
+        instance: The Property instance triggering the invalidation
+        **clear_kwargs: Passed through to _clear_property_cache
+    """
+    conn = transaction.get_connection()
+
+    if conn.in_atomic_block and any(
+        getattr(entry[1], '_property_cache_flush', False)
+        for entry in conn.run_on_commit
+    ):
+        return
+
+    def _run():
+        _clear_property_cache(instance, **clear_kwargs)
+
+    _run._property_cache_flush = True
+    transaction.on_commit(_run)
+
+
+def _unlink_keys_matching(patterns, keys=(), counter_key=None):
+    """
+    Delete cache keys matching the given patterns without blocking Redis.
+
+    Uses SCAN (incremental, non-blocking) instead of KEYS (O(N) over the
+    whole keyspace), and UNLINK in a single pipeline so key freeing happens
+    on Redis' background thread in one round trip.
+
+    Args:
+        patterns: Iterable of un-prefixed cache key patterns (e.g. 'property_*')
+        keys: Iterable of un-prefixed exact cache keys to unlink as well
+        counter_key: Optional un-prefixed key to INCR atomically in the
+            same pipeline (replaces a racy get + set pair)
+
+    Returns:
+        list: The raw Redis keys that were unlinked
+    """
+    conn = get_redis_connection('default')
+    pipe = conn.pipeline()
+    matched_keys = []
+
+    # make_key applies the configured KEY_PREFIX/version
+    for key in keys:
+        full_key = cache.make_key(key)
+        pipe.unlink(full_key)
+        matched_keys.append(full_key)
+
+    for pattern in patterns:
+        for key in conn.scan_iter(match=cache.make_key(pattern), count=500):
+            pipe.unlink(key)
+            matched_keys.append(key)
+
+    if counter_key is not None:
+        pipe.incr(cache.make_key(counter_key))
+
+    if matched_keys or counter_key is not None:
+        pipe.execute()
+
+    return matched_keys
+
 @receiver(post_save, sender=Property)
 def invalidate_cache_on_save(sender, instance, created, **kwargs):
     """
@@ -19,10 +321,21 @@ def invalidate_cache_on_save(sender, instance, created, **kwargs):
         created: Boolean indicating if this is a new instance
         **kwargs: Additional arguments
     """
-    # Use transaction.on_commit to ensure cache is cleared after successful save
-    transaction.on_commit(
-        lambda: _clear_property_cache(instance, created)
-    )
+    # Use transaction.on_commit to ensure cache is cleared after successful save,
+    # coalesced to one flush per transaction
+    _schedule_cache_invalidation(instance, created=created)
+
+    # Per-object version bump so versioned detail keys go stale in O(1)
+    transaction.on_commit(lambda: _bump_property_version(instance.pk))
+
+    # Keep the hash store current instead of invalidating it
+    transaction.on_commit(lambda: _write_through_property(instance))
+
+    # One INCR retires every versioned list key
+    transaction.on_commit(_bump_properties_version)
+
+    if created:
+        transaction.on_commit(lambda: _adjust_property_count(1))
 
 @receiver(post_delete, sender=Property)
 def invalidate_cache_on_delete(sender, instance, **kwargs):
@@ -34,37 +347,24 @@ def invalidate_cache_on_delete(sender, instance, **kwargs):
         instance: The actual instance being deleted
         **kwargs: Additional arguments
     """
-    # Use transaction.on_commit to ensure cache is cleared after successful deletion
-    transaction.on_commit(
-        lambda: _clear_property_cache(instance, is_delete=True)
-    )
+    # Use transaction.on_commit to ensure cache is cleared after successful deletion,
+    # coalesced to one flush per transaction
+    _schedule_cache_invalidation(instance, is_delete=True)
 
-@receiver(m2m_changed, sender=Property.amenities.through)
-def invalidate_cache_on_m2m_change(sender, instance, action, **kwargs):
-    """
-    Invalidate cache when ManyToMany relationships change.
-    
-    Args:
-        sender: The intermediate model
-        instance: The Property instance
-        action: The action being performed (pre_add, post_add, pre_remove, post_remove, pre_clear, post_clear)
-        **kwargs: Additional arguments
-    """
-    if action in ['post_add', 'post_remove', 'post_clear']:
-        logger.info(f"Property amenities changed for {instance.id}, invalidating cache...")
-        transaction.on_commit(
-            lambda: _clear_property_cache(instance, is_m2m_change=True)
-        )
+    pk = instance.pk
+    transaction.on_commit(lambda: _bump_property_version(pk))
+    transaction.on_commit(lambda: _remove_property_hash(pk))
+    transaction.on_commit(_bump_properties_version)
+    transaction.on_commit(lambda: _adjust_property_count(-1))
 
-def _clear_property_cache(instance, created=False, is_delete=False, is_m2m_change=False):
+def _clear_property_cache(instance, created=False, is_delete=False):
     """
     Clear all property-related cache entries.
-    
+
     Args:
         instance: Property instance
         created: Whether this is a new property
         is_delete: Whether this is a deletion
-        is_m2m_change: Whether this is a ManyToMany change
     """
     try:
         # Main cache key to delete
@@ -75,38 +375,23 @@ def _clear_property_cache(instance, created=False, is_delete=False, is_m2m_chang
             main_cache_key,
             f'{main_cache_key}_meta',
         ]
-        
-        # Add pattern-based cache keys
-        cache_patterns = [
-            'properties_location_*',
-            'properties_price_*',
-            'property_*',  # Individual property cache
-        ]
-        
-        # Delete specific keys
-        deleted_keys = []
-        for key in cache_keys_to_delete:
-            if cache.delete(key):
-                deleted_keys.append(key)
-                logger.info(f"Deleted cache key: {key}")
-        
-        # Delete pattern-based keys (Redis-specific)
+
+        # Unlink every tagged property key plus the known keys, and bump
+        # the invalidation counter atomically, all in one round trip
         try:
-            for pattern in cache_patterns:
-                keys = cache.keys(pattern)
-                if keys:
-                    cache.delete_many(keys)
-                    deleted_keys.extend(keys)
-                    logger.info(f"Deleted {len(keys)} keys matching pattern: {pattern}")
-        except AttributeError:
-            # Some cache backends don't support pattern deletion
-            logger.warning("Pattern-based cache deletion not supported by this backend")
-        
+            deleted_keys = _unlink_tagged_keys(
+                keys=cache_keys_to_delete,
+                counter_key='cache_invalidation_count',
+            )
+            logger.info(f"Unlinked {len(deleted_keys)} tagged cache keys in one pipeline")
+        except NotImplementedError:
+            # Some cache backends don't support the tag set
+            logger.warning("Tag-based cache invalidation not supported by this backend")
+            deleted_keys = [key for key in cache_keys_to_delete if cache.delete(key)]
+
         # Log the action
         action_type = "created" if created else "deleted" if is_delete else "updated"
-        if is_m2m_change:
-            action_type = "M2M relationship changed"
-        
+
         logger.info(f"✅ Cache invalidated for property {instance.id} ({action_type})")
         logger.info(f"   Total cache keys deleted: {len(deleted_keys)}")
         
@@ -119,29 +404,14 @@ def _clear_property_cache(instance, created=False, is_delete=False, is_m2m_chang
             'timestamp': instance.updated_at.isoformat() if hasattr(instance, 'updated_at') else None,
         }
         
-        # Store last invalidation event (optional, for debugging)
+        # Store last invalidation event (optional, for debugging);
+        # the counter was already INCRed in the delete pipeline
         cache.set('last_cache_invalidation', invalidation_event, timeout=3600)
-        
-        # Increment invalidation counter
-        invalidation_count = cache.get('cache_invalidation_count', 0)
-        cache.set('cache_invalidation_count', invalidation_count + 1, timeout=None)
-        
+
     except Exception as e:
         logger.error(f"❌ Failed to invalidate cache for property {instance.id}: {e}")
 
 
-# Signal for bulk operations (if using queryset.update() or bulk_create)
-@receiver(post_save, sender=Property)
-def handle_bulk_operations(sender, **kwargs):
-    """
-    Handle cache invalidation for bulk operations.
-    This is triggered for each instance in bulk operations.
-    """
-    # For bulk operations, we might want different behavior
-    # Currently handled by the main post_save signal
-    pass
-
-
 # Additional utility functions for cache management
 def get_cache_invalidation_stats():
     """
@@ -150,12 +420,27 @@ def get_cache_invalidation_stats():
     Returns:
         dict: Cache invalidation statistics
     """
+    # EXISTS + ZCARD in one pipeline; the list now lives in the hash
+    # store, so the index tells whether and how much is populated.
+    # Degrade like IGNORE_EXCEPTIONS does rather than 500 the monitor
+    # page when Redis is unreachable.
+    try:
+        conn = get_redis_connection('default')
+        pipe = conn.pipeline()
+        index_key = cache.make_key(PROPERTY_INDEX_KEY)
+        pipe.exists(index_key)
+        pipe.zcard(index_key)
+        exists, indexed = pipe.execute()
+    except Exception:
+        logger.debug("Cache stats unavailable", exc_info=True)
+        exists, indexed = 0, 0
+
     stats = {
         'total_invalidations': cache.get('cache_invalidation_count', 0),
         'last_invalidation': cache.get('last_cache_invalidation'),
         'current_cache_state': {
-            'all_properties_cached': cache.get('all_properties') is not None,
-            'all_properties_ttl': cache.ttl('all_properties') if cache.get('all_properties') else None,
+            'all_properties_cached': bool(exists),
+            'indexed_properties': indexed,
         }
     }
     return stats
@@ -179,21 +464,13 @@ def clear_all_property_cache():
     ]
     
     deleted_count = 0
-    
-    # Delete specific keys
-    for key in keys_to_delete:
-        if cache.delete(key):
-            deleted_count += 1
-    
-    # Delete pattern-based keys
+
+    # Specific keys and pattern matches in a single pipeline
     try:
-        for pattern in patterns_to_delete:
-            keys = cache.keys(pattern)
-            if keys:
-                cache.delete_many(keys)
-                deleted_count += len(keys)
-    except AttributeError:
+        deleted_count = len(_unlink_keys_matching(patterns_to_delete, keys=keys_to_delete))
+    except NotImplementedError:
         logger.warning("Pattern-based deletion not supported")
-    
+        deleted_count = sum(1 for key in keys_to_delete if cache.delete(key))
+
     logger.info(f"Cleared {deleted_count} cache entries")
     return deleted_count
@@ -6,4 +6,9 @@ urlpatterns = [
     path('', views.PropertyListView.as_view(), name='property_list'),
     path('<int:pk>/', views.PropertyDetailView.as_view(), name='property_detail'),
     path('monitor/', views.cache_monitor, name='cache_monitor'),
+    # JSON endpoints get their own routes: no per-request header
+    # sniffing, and the API paths skip template context entirely
+    path('api/cache-monitor/', views.cache_monitor_json, name='cache_monitor_json'),
+    path('api/cache-metrics/', views.cache_metrics_json, name='cache_metrics_json'),
+    path('api/cache-analysis/', views.cache_analysis_json, name='cache_analysis_json'),
 ]
@@ -1,174 +1,257 @@
 # properties/utils.py
 from django.core.cache import cache
-from django.db.models import QuerySet
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
+import redis
+
+from django_redis import get_redis_connection
+
+from .signals import (
+    PROPERTY_COUNT_KEY,
+    PROPERTY_INDEX_KEY,
+    PROPERTY_TAG_KEY,
+    property_hash_key,
+    tag_property_cache_key,
+)
+
 logger = logging.getLogger(__name__)
 
-def get_all_properties():
-    pass
 
-def get_all_properties() -> QuerySet:
+def _decode_property_hash(raw):
+    """Turn an HGETALL reply into the dict shape callers expect."""
+    row = {
+        key.decode() if isinstance(key, bytes) else key:
+        value.decode() if isinstance(value, bytes) else value
+        for key, value in raw.items()
+    }
+    # Redis hash values are strings; restore the integer fields so
+    # consumers (templates, Property(**row)) see the right types
+    for field in ('id', 'bedrooms', 'bathrooms_halves'):
+        if field in row:
+            row[field] = int(row[field])
+    return row
+
+
+def get_all_properties() -> List[dict]:
     """
-    Retrieve all properties with low-level Redis caching.
-    
+    Retrieve all properties from the per-property hash store.
+
+    Each property lives in its own Redis Hash (property:{id}) with a
+    sorted set (properties:by_created) as the newest-first index. The
+    write signals keep both current, so a property write touches O(1)
+    keys instead of blowing away one global blob and forcing every
+    reader back to the database at once.
+
     Returns:
-        QuerySet: All Property objects, either from cache or database
+        list: Property dicts, newest first
     """
-    cache_key = 'all_properties'
-    
-    # Try to get from cache
-    logger.info(f"Attempting to retrieve properties from cache with key: {cache_key}")
-    cached_data = cache.get(cache_key)
-    
-    if cached_data is not None:
-        logger.info(f"✅ Cache HIT for key: {cache_key}")
-        
-        # Log cache statistics
-        try:
-            # Get TTL for cache key
-            ttl = cache.ttl(cache_key)
-            if ttl:
-                logger.info(f"   Cache TTL remaining: {ttl} seconds")
-        except:
-            pass
-        
-        return cached_data
-    
-    # Cache miss - fetch from database
-    logger.info(f"❌ Cache MISS for key: {cache_key}. Fetching from database...")
-    
     try:
-        # Fetch all properties from database with optimization
+        conn = get_redis_connection('default')
+        # Scores are -created_at, so ascending ZRANGE is newest-first
+        ids = conn.zrange(cache.make_key(PROPERTY_INDEX_KEY), 0, -1)
+    except Exception:
+        conn, ids = None, []
+
+    if ids:
+        pipe = conn.pipeline()
+        for pk in ids:
+            pk = pk.decode() if isinstance(pk, bytes) else pk
+            pipe.hgetall(cache.make_key(property_hash_key(pk)))
+        replies = pipe.execute()
+
+        rows = [_decode_property_hash(raw) for raw in replies if raw]
+        if len(rows) == len(ids):
+            logger.debug("Hash store HIT: %d properties", len(rows))
+            return rows
+        # Index and hashes disagree (partial flush); rebuild below
+
+    logger.debug("Hash store MISS. Rebuilding from database...")
+
+    # Dogpile protection: only the worker holding the lock rebuilds;
+    # everyone else polls the index briefly instead of hitting the DB
+    lock_key = cache.make_key('all_properties:lock')
+    have_lock = conn is None or bool(conn.set(lock_key, '1', nx=True, ex=30))
+
+    if not have_lock:
+        for _ in range(10):
+            time.sleep(0.05)
+            if conn.zcard(cache.make_key(PROPERTY_INDEX_KEY)):
+                return get_all_properties()
+        # Lock holder is taking too long; rebuild ourselves
+
+    try:
         from .models import Property
-        
-        start_time = datetime.now()
-        queryset = Property.objects.all().select_related().order_by('-created_at')
-        
-        # Force evaluation of queryset to cache the results
-        properties_list = list(queryset)
-        
-        end_time = datetime.now()
-        fetch_time = (end_time - start_time).total_seconds()
-        
-        logger.info(f"   Database fetch completed in {fetch_time:.3f} seconds")
-        logger.info(f"   Retrieved {len(properties_list)} properties")
-        
-        # Store in cache for 1 hour (3600 seconds)
-        logger.info(f"   Storing in cache with TTL: 3600 seconds")
-        cache.set(cache_key, queryset, timeout=3600)
-        
-        # Also store metadata
-        cache_meta_key = f"{cache_key}_meta"
-        metadata = {
-            'cached_at': datetime.now().isoformat(),
-            'count': len(properties_list),
-            'fetch_time': fetch_time,
-            'source': 'database'
-        }
-        cache.set(cache_meta_key, metadata, timeout=3600)
-        
-        return queryset
-        
+
+        start_time = time.perf_counter()
+
+        # Same projection the list view renders (views.PROPERTY_LIST_FIELDS)
+        properties_list = list(
+            Property.objects.order_by('-created_at').values(
+                'id', 'title', 'description', 'price', 'location',
+                'property_type', 'bedrooms', 'bathrooms_halves',
+                'status', 'created_at',
+            )
+        )
+
+        fetch_time = time.perf_counter() - start_time
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Database fetch completed in %.3f seconds", fetch_time)
+            logger.debug("Retrieved %d properties into hash store", len(properties_list))
+
+        if conn is not None and properties_list:
+            # One pipeline fills every hash and the whole index
+            pipe = conn.pipeline()
+            scores = {}
+            for row in properties_list:
+                pipe.hset(
+                    cache.make_key(property_hash_key(row['id'])),
+                    mapping={
+                        **row,
+                        'price': str(row['price']),
+                        'created_at': row['created_at'].isoformat(),
+                    },
+                )
+                scores[str(row['id'])] = -row['created_at'].timestamp()
+            pipe.zadd(cache.make_key(PROPERTY_INDEX_KEY), scores)
+            pipe.execute()
+
+        # orjson round trip gives the same plain-JSON types (str price,
+        # isoformat created_at) as the hash-store hit path
+        return orjson.loads(orjson.dumps(properties_list, default=str))
+
     except Exception as e:
         logger.error(f"Error fetching properties: {e}")
         raise
+    finally:
+        if have_lock and conn is not None:
+            conn.delete(lock_key)
+
 
+def get_total_properties() -> int:
+    """
+    Get the total number of properties, served from cache.
+
+    A full-table COUNT(*) scales with row count on PostgreSQL; the
+    save/delete signals keep PROPERTY_COUNT_KEY current with O(1)
+    INCR/DECR, so the database is only hit when the key is missing.
+
+    Returns:
+        int: Total property count
+    """
+    total = cache.get(PROPERTY_COUNT_KEY)
+
+    if total is None:
+        from .models import Property
+
+        total = Property.objects.count()
+        cache.set(PROPERTY_COUNT_KEY, total, timeout=3600)
+
+    return int(total)
 
-def get_properties_by_location(location: str) -> QuerySet:
+
+def get_properties_by_location(location: str) -> "List[Property]":
     """
     Get properties by location with caching.
-    
+
     Args:
         location (str): Location to filter properties
-        
+
     Returns:
-        QuerySet: Filtered properties
+        list: Filtered properties
     """
     cache_key = f'properties_location_{location.lower().replace(" ", "_")}'
-    
-    cached_data = cache.get(cache_key)
-    
-    if cached_data is not None:
-        logger.info(f"Cache HIT for location: {location}")
-        return cached_data
-    
-    logger.info(f"Cache MISS for location: {location}")
-    
+
     from .models import Property
-    queryset = Property.objects.filter(
-        location__icontains=location
-    ).order_by('-created_at')
-    
-    # Cache for 30 minutes (1800 seconds)
-    cache.set(cache_key, queryset, timeout=1800)
-    
-    return queryset
 
+    # get_or_set issues a single Redis round trip on hits and lets the
+    # backend populate the key atomically on misses
+    properties_list = cache.get_or_set(
+        cache_key,
+        lambda: list(Property.objects.filter(
+            location__icontains=location
+        ).order_by('-created_at')),
+        timeout=1800,  # 30 minutes
+    )
+    tag_property_cache_key(cache_key)
+
+    return properties_list
 
-def get_properties_by_price_range(min_price: float, max_price: float) -> QuerySet:
+
+def get_properties_by_price_range(min_price: float, max_price: float) -> "List[Property]":
     """
     Get properties within a price range with caching.
-    
+
     Args:
         min_price (float): Minimum price
         max_price (float): Maximum price
-        
+
     Returns:
-        QuerySet: Filtered properties
+        list: Filtered properties
     """
     cache_key = f'properties_price_{min_price}_{max_price}'
-    
-    cached_data = cache.get(cache_key)
-    
-    if cached_data is not None:
-        logger.info(f"Cache HIT for price range: ${min_price}-${max_price}")
-        return cached_data
-    
-    logger.info(f"Cache MISS for price range: ${min_price}-${max_price}")
-    
+
     from .models import Property
-    queryset = Property.objects.filter(
-        price__gte=min_price,
-        price__lte=max_price
-    ).order_by('price')
-    
-    # Cache for 15 minutes (900 seconds)
-    cache.set(cache_key, queryset, timeout=900)
-    
-    return queryset
+
+    properties_list = cache.get_or_set(
+        cache_key,
+        lambda: list(Property.objects.filter(
+            price__gte=min_price,
+            price__lte=max_price
+        ).order_by('price')),
+        timeout=900,  # 15 minutes
+    )
+    tag_property_cache_key(cache_key)
+
+    return properties_list
 
 
 def invalidate_property_cache():
     """
     Invalidate all property-related cache keys.
     """
-    from django.core.cache import cache
-    
-    # List of cache key patterns to invalidate
-    cache_patterns = [
-        'all_properties',
-        'all_properties_meta',
-        'properties_location_*',
-        'properties_price_*',
-        'property_*',  # Individual property cache
-    ]
-    
+    client = _get_redis_client()
+    if client is None:
+        logger.warning("No Redis client available for cache invalidation")
+        return 0
+
+    # Every property cache write registers its key in the tag set, so
+    # invalidation reads the set instead of scanning the keyspace
+    tag_key = cache.make_key(PROPERTY_TAG_KEY)
+    all_keys = list(client.smembers(tag_key))
+    all_keys.append(tag_key)
+
+    # The list lives in the per-property hash store, whose keys have no
+    # TTL and are not tagged: drop every hash the index knows about,
+    # then the index itself
+    index_key = cache.make_key(PROPERTY_INDEX_KEY)
+    for pk in client.zrange(index_key, 0, -1):
+        pk = pk.decode() if isinstance(pk, bytes) else pk
+        all_keys.append(cache.make_key(property_hash_key(pk)))
+    all_keys.append(index_key)
+
+    # One variadic DEL per 10k keys, pipelined into a single round trip
     invalidated_count = 0
-    
-    for pattern in cache_patterns:
-        try:
-            # Get all keys matching pattern
-            keys = cache.keys(pattern)
-            if keys:
-                cache.delete_many(keys)
-                invalidated_count += len(keys)
-                logger.info(f"Invalidated {len(keys)} keys matching pattern: {pattern}")
-        except Exception as e:
-            logger.warning(f"Could not invalidate pattern {pattern}: {e}")
-    
+    try:
+        pipe = client.pipeline()
+        for start in range(0, len(all_keys), 10000):
+            pipe.delete(*all_keys[start:start + 10000])
+        pipe.execute()
+        invalidated_count = len(all_keys)
+    except redis.ResponseError as e:
+        # Fall back to sequential deletes if the server rejects the batch
+        logger.warning(f"Batched delete failed, falling back to per-key: {e}")
+        for key in all_keys:
+            try:
+                invalidated_count += client.delete(key)
+            except Exception:
+                pass
+
     logger.info(f"Total cache keys invalidated: {invalidated_count}")
     return invalidated_count
 
@@ -183,27 +266,23 @@ def get_cache_stats() -> dict:
     stats = {
         'all_properties': {
             'cached': False,
-            'ttl': None,
-            'metadata': None,
+            'count': None,
         },
         'locations': {},
         'price_ranges': {},
     }
-    
-    # Check all_properties cache
-    cache_key = 'all_properties'
-    if cache.get(cache_key) is not None:
-        stats['all_properties']['cached'] = True
-        ttl = cache.ttl(cache_key)
-        if ttl:
-            stats['all_properties']['ttl'] = ttl
-        
-        # Get metadata
-        meta_key = f"{cache_key}_meta"
-        metadata = cache.get(meta_key)
-        if metadata:
-            stats['all_properties']['metadata'] = metadata
-    
+
+    # The list now lives in the hash store; ZCARD of the index tells
+    # whether (and how much of) it is populated
+    try:
+        conn = get_redis_connection('default')
+        indexed = conn.zcard(cache.make_key(PROPERTY_INDEX_KEY))
+        if indexed:
+            stats['all_properties']['cached'] = True
+            stats['all_properties']['count'] = indexed
+    except Exception:
+        pass
+
     return stats
 
 
@@ -228,57 +307,97 @@ class PropertyCacheManager:
     def warm_cache():
         """
         Warm up the cache by pre-loading frequently accessed data.
+
+        Fetches every warm-up bucket with a single Q()-union query,
+        slices the rows in Python, and flushes all cache writes through
+        one Redis pipeline instead of one DB + Redis round trip each.
         """
         logger.info("Warming up property cache...")
-        
+
         # Pre-load all properties
         get_all_properties()
-        
-        # Pre-load by common locations
+
         common_locations = ['New York', 'Los Angeles', 'Chicago', 'Miami', 'Seattle']
-        for location in common_locations:
-            get_properties_by_location(location)
-        
-        # Pre-load common price ranges
         price_ranges = [
             (0, 500000),
             (500000, 1000000),
             (1000000, 5000000)
         ]
+
+        from django.db.models import Q
+        from .models import Property
+
+        combined_q = Q()
+        for location in common_locations:
+            combined_q |= Q(location__icontains=location)
         for min_price, max_price in price_ranges:
-            get_properties_by_price_range(min_price, max_price)
-        
+            combined_q |= Q(price__gte=min_price, price__lte=max_price)
+
+        rows = list(Property.objects.filter(combined_q).order_by('-created_at'))
+
+        # Bucket in Python, mirroring each getter's key and ordering
+        cache_map = {}
+        for location in common_locations:
+            key = f'properties_location_{location.lower().replace(" ", "_")}'
+            needle = location.lower()
+            cache_map[key] = (1800, [p for p in rows if needle in p.location.lower()])
+
+        rows_by_price = sorted(rows, key=lambda p: p.price)
+        for min_price, max_price in price_ranges:
+            key = f'properties_price_{min_price}_{max_price}'
+            cache_map[key] = (
+                900,
+                [p for p in rows_by_price if min_price <= p.price <= max_price],
+            )
+
+        client = _get_redis_client()
+        if client is not None and hasattr(cache, 'client'):
+            tag_key = cache.make_key(PROPERTY_TAG_KEY)
+            pipe = client.pipeline()
+            for key, (ttl, value) in cache_map.items():
+                full_key = cache.make_key(key)
+                pipe.set(full_key, cache.client.encode(value), ex=ttl)
+                pipe.sadd(tag_key, full_key)
+            pipe.execute()
+        else:
+            for key, (ttl, value) in cache_map.items():
+                cache.set(key, value, timeout=ttl)
+                tag_property_cache_key(key)
+
         logger.info("Cache warm-up completed")
     
     @staticmethod
     def clear_pattern(pattern: str):
         """
         Clear cache keys matching a pattern.
-        
+
         Args:
             pattern (str): Pattern to match cache keys
         """
         try:
-            keys = cache.keys(pattern)
-            if keys:
-                cache.delete_many(keys)
-                logger.info(f"Cleared {len(keys)} keys matching pattern: {pattern}")
-                return len(keys)
+            client = _get_redis_client()
+            if client is None:
+                return 0
+
+            cleared = 0
+            batch = []
+            for key in client.scan_iter(match=cache.make_key(pattern), count=10000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    client.delete(*batch)
+                    cleared += len(batch)
+                    batch = []
+            if batch:
+                client.delete(*batch)
+                cleared += len(batch)
+
+            if cleared:
+                logger.info(f"Cleared {cleared} keys matching pattern: {pattern}")
+            return cleared
         except Exception as e:
             logger.error(f"Error clearing pattern {pattern}: {e}")
             return 0
 
-# properties/utils.py
-from django.core.cache import cache
-from django.db.models import QuerySet
-from typing import Dict, Any, Optional, Tuple
-import logging
-import redis
-from datetime import datetime, timedelta
-import json
-
-logger = logging.getLogger(__name__)
-
 def get_redis_cache_metrics() -> Dict[str, Any]:
     """
     Retrieve and analyze Redis cache hit/miss metrics.
@@ -311,9 +430,21 @@ def get_redis_cache_metrics() -> Dict[str, Any]:
             logger.error(metrics['message'])
             return metrics
         
-        # Get Redis INFO command output
-        redis_info = redis_client.info()
-        
+        # Fetch only the INFO sections we read (~1KB each vs dozens of
+        # KB for the full block), pipelined into one round trip, and
+        # micro-cache the merged result so back-to-back dashboard hits
+        # share a single fetch
+        redis_info = cache.get('redis_info_cache')
+        if redis_info is None:
+            pipe = redis_client.pipeline()
+            for section in ('stats', 'memory', 'clients', 'keyspace', 'server'):
+                pipe.info(section)
+            redis_info = {}
+            for section_info in pipe.execute():
+                redis_info.update(section_info)
+            cache.set('redis_info_cache', redis_info, timeout=5)
+
+
         # Extract cache metrics
         hits = redis_info.get('keyspace_hits', 0)
         misses = redis_info.get('keyspace_misses', 0)
@@ -366,66 +497,56 @@ def get_redis_cache_metrics() -> Dict[str, Any]:
     except Exception as e:
         metrics['message'] = f'Error getting cache metrics: {str(e)}'
         logger.error(metrics['message'])
-    total_requests = 0
-    return total_requests if total_requests > 0 else 0
+
     return metrics
 
-def get_redis_cache_metrics():
-    pass 
+
+# Resolved once and reused so the metrics pollers don't pay the lookup
+# per call. This must be the raw redis.Redis connection — django-redis's
+# DefaultClient wrapper has none of the commands (smembers, pipeline,
+# info, scan_iter, rpush) the helpers below are built on.
+_REDIS_CLIENT: Optional[redis.Redis] = None
+
 
 def _get_redis_client() -> Optional[redis.Redis]:
     """
-    Get Redis client from Django cache backend.
-    
+    Get the raw Redis client behind the default cache (memoized).
+
     Returns:
-        Redis client or None if not available
+        redis.Redis client or None if not available
     """
-    try:
-        # Try to get Redis client from django-redis
-        if hasattr(cache, '_client'):
-            return cache._client
-        
-        # Try alternative ways to get Redis client
-        if hasattr(cache, '_cache'):
-            cache_backend = cache._cache
-            if hasattr(cache_backend, 'client'):
-                return cache_backend.client
-            elif hasattr(cache_backend, '_client'):
-                return cache_backend._client
-        
-        # Try to create Redis client from settings
-        from django.conf import settings
-        cache_settings = settings.CACHES['default']
-        
-        if 'LOCATION' in cache_settings:
-            location = cache_settings['LOCATION']
-            if location.startswith('redis://'):
-                import redis
-                return redis.from_url(location)
-        
-        logger.warning("Could not get Redis client from cache backend")
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error getting Redis client: {e}")
-        return None
+    global _REDIS_CLIENT
+
+    if _REDIS_CLIENT is None:
+        try:
+            _REDIS_CLIENT = get_redis_connection('default')
+        except Exception as e:
+            logger.error(f"Error getting Redis client: {e}")
+            return None
+
+    return _REDIS_CLIENT
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def _format_bytes(bytes_size: int) -> str:
     """
     Format bytes to human readable string.
-    
+
     Args:
         bytes_size: Size in bytes
-        
+
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.2f} TB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.2f} B"
+
+    # bit_length() // 10 picks the unit in constant time instead of
+    # looping through divisions
+    index = min(int(bytes_size).bit_length() // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_size / (1 << (index * 10)):.2f} {_BYTE_UNITS[index]}"
 
 
 def _format_seconds(seconds: int) -> str:
@@ -466,10 +587,7 @@ def _store_metrics_history(metrics: Dict[str, Any]) -> None:
     try:
         history_key = 'cache_metrics_history'
         max_history = 1440  # 24 hours of minute-level data
-        
-        # Get existing history
-        history = cache.get(history_key) or []
-        
+
         # Add current metrics (store only essential data)
         history_entry = {
             'timestamp': metrics['timestamp'],
@@ -479,16 +597,19 @@ def _store_metrics_history(metrics: Dict[str, Any]) -> None:
             'keys_count': metrics['keys_count'],
             'connected_clients': metrics['connected_clients'],
         }
-        
-        history.append(history_entry)
-        
-        # Keep only last max_history entries
-        if len(history) > max_history:
-            history = history[-max_history:]
-        
-        # Store back to cache
-        cache.set(history_key, history, timeout=None)  # Persistent
-        
+
+        client = _get_redis_client()
+        if client is None:
+            return
+
+        # Atomic O(1) append + trim as a Redis list, instead of pulling
+        # the whole history down, appending, and writing it all back
+        full_key = cache.make_key(history_key)
+        pipe = client.pipeline()
+        pipe.rpush(full_key, orjson.dumps(history_entry))
+        pipe.ltrim(full_key, -max_history, -1)
+        pipe.execute()
+
     except Exception as e:
         logger.warning(f"Could not store metrics history: {e}")
 
@@ -564,18 +685,32 @@ def get_cache_metrics_trend() -> Dict[str, Any]:
     """
     try:
         history_key = 'cache_metrics_history'
-        history = cache.get(history_key) or []
-        
-        if not history:
+
+        client = _get_redis_client()
+        if client is None:
             return {
                 'status': 'no_data',
                 'message': 'No historical data available',
                 'trend': 'unknown',
             }
-        
-        # Calculate trend based on last 10 entries
-        recent = history[-10:] if len(history) >= 10 else history
-        
+
+        # Only the 10-entry tail is needed for the trend; LRANGE fetches
+        # just that slice and LLEN reports the full depth
+        full_key = cache.make_key(history_key)
+        pipe = client.pipeline()
+        pipe.llen(full_key)
+        pipe.lrange(full_key, -10, -1)
+        history_length, raw_entries = pipe.execute()
+
+        if not raw_entries:
+            return {
+                'status': 'no_data',
+                'message': 'No historical data available',
+                'trend': 'unknown',
+            }
+
+        recent = [orjson.loads(entry) for entry in raw_entries]
+
         hit_percentages = [entry['hit_percentage'] for entry in recent]
         
         if len(hit_percentages) < 2:
@@ -613,8 +748,8 @@ def get_cache_metrics_trend() -> Dict[str, Any]:
             'trend_value': trend_value,
             'current_hit_rate': last,
             'average_hit_rate': sum(hit_percentages) / len(hit_percentages),
-            'data_points': len(history),
-            'time_period': f'{len(history)} minutes',
+            'data_points': history_length,
+            'time_period': f'{history_length} minutes',
         }
         
     except Exception as e:
@@ -663,25 +798,42 @@ def reset_cache_metrics() -> Dict[str, Any]:
         }
 
 
-def get_detailed_cache_analysis() -> Dict[str, Any]:
+def get_detailed_cache_analysis(
+    metrics: Optional[Dict[str, Any]] = None,
+    trend: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Get detailed cache analysis with recommendations.
-    
+
+    Args:
+        metrics: Precomputed get_redis_cache_metrics() result, so a
+            caller that already collected it (the background refresher)
+            doesn't trigger a second INFO fetch and history append
+        trend: Precomputed get_cache_metrics_trend() result, same idea
+
     Returns:
         Comprehensive cache analysis
     """
-    # Get current metrics
-    metrics = get_redis_cache_metrics()
-    
+    # The collectors are independent and each Redis-bound, so whichever
+    # still need running go on worker threads to overlap the waits
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        metrics_future = (
+            executor.submit(get_redis_cache_metrics) if metrics is None else None
+        )
+        trend_future = (
+            executor.submit(get_cache_metrics_trend) if trend is None else None
+        )
+        info_future = executor.submit(_get_property_cache_info)
+
+        if metrics_future is not None:
+            metrics = metrics_future.result()
+        if trend_future is not None:
+            trend = trend_future.result()
+        property_cache_info = info_future.result()
+
     if metrics['status'] != 'success':
         return metrics
-    
-    # Get trend analysis
-    trend = get_cache_metrics_trend()
-    
-    # Get property-specific cache info
-    property_cache_info = _get_property_cache_info()
-    
+
     # Compile comprehensive analysis
     analysis = {
         'summary': {
@@ -722,36 +874,26 @@ def _get_property_cache_info() -> Dict[str, Any]:
     """
     try:
         redis_client = _get_redis_client()
-        
+
         if not redis_client:
             return {'error': 'Could not connect to Redis'}
-        
-        # Count property-related cache keys
-        property_patterns = ['all_properties*', 'property_*', 'properties_*']
-        
-        cached_keys = []
-        total_cached = 0
-        
-        for pattern in property_patterns:
-            try:
-                keys = redis_client.keys(pattern)
-                cached_keys.extend(keys)
-                total_cached += len(keys)
-            except:
-                pass
-        
-        # Check if main properties cache exists
-        main_cache_exists = redis_client.exists('all_properties')
-        
+
+        # The tag set already indexes every property cache key, so the
+        # count is a single O(1) SCARD and the sample a SRANDMEMBER —
+        # no blocking KEYS scan over the keyspace
+        tag_key = cache.make_key(PROPERTY_TAG_KEY)
+        pipe = redis_client.pipeline()
+        pipe.scard(tag_key)
+        pipe.srandmember(tag_key, 10)
+        pipe.exists(cache.make_key(PROPERTY_INDEX_KEY))
+        total_cached, sample_keys, main_cache_exists = pipe.execute()
+
         return {
             'cached_count': total_cached,
             'main_cache_exists': bool(main_cache_exists),
-            'cache_keys': cached_keys[:10],  # First 10 keys
-            'total_keys_found': len(cached_keys),
+            'cache_keys': sample_keys,  # Up to 10 sampled keys
+            'total_keys_found': total_cached,
         }
-        
+
     except Exception as e:
         return {'error': str(e)}
-
-def test_fx(n):
-    return n + 1
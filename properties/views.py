@@ -1,68 +1,319 @@
 # properties/views.py
 from django.shortcuts import render
-from django.views.generic import ListView, DetailView
+from django.views.generic import ListView, DetailView, TemplateView
 from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from .models import Property
-from django.http import JsonResponse
-from django.utils.decorators import method_decorator
-from django.views.generic import ListView
-from django.core.cache import cache
+from django.http import Http404, HttpResponse, JsonResponse
 import logging
-from properties.signals import get_cache_invalidation_stats
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+from django.db import close_old_connections
+
+import orjson
+from django_redis import get_redis_connection
+from properties.signals import (
+    get_cache_invalidation_stats,
+    get_properties_version,
+    property_version_key,
+    tag_property_cache_key,
+)
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
-@cache_page(60 * 15)
-def property_list(request):
-    return JsonResponse({request.data})
+# Shared pool for off-request work (SWR refresh, detail prefetch). A
+# raw thread per request opens a fresh DB connection each time and
+# never returns it to Django's pool, leaking one Postgres connection
+# per spawn under load; a small fixed pool caps that at max_workers
+# and the workers release their connections when each job ends.
+_background_pool = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='properties-bg'
+)
 
 
-class PropertyListView(ListView):
-    model = Property
-    template_name = 'properties/property_list.html'
-    context_object_name = 'properties'
-    paginate_by = 10
-    
-    @cache_page(60 * 5)  # Cache for 5 minutes
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
-    
-    def get_queryset(self):
-        cache_key = 'properties_list'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return cached_data
-        
-        queryset = Property.objects.filter(status='available').order_by('-created_at')
-        cache.set(cache_key, queryset, 60 * 5)  # Cache for 5 minutes
-        return queryset
+def _run_in_background(func, *args):
+    """Run ``func`` on the shared pool, releasing DB connections after."""
+    def _job():
+        try:
+            func(*args)
+        except Exception:
+            logger.debug("Background job %s failed", func.__name__, exc_info=True)
+        finally:
+            close_old_connections()
+
+    try:
+        _background_pool.submit(_job)
+    except RuntimeError:
+        # Pool already shut down (interpreter exit); drop the job
+        pass
+
+
+def get_or_populate_cache(cache_key, producer, timeout, tag=True):
+    """
+    Cache-aside read with a single-flight miss path.
+
+    On a miss, only the worker that wins a short SET NX lock runs
+    ``producer`` and writes the result; everyone else polls the cache
+    briefly and picks up the freshly written value. This stops a hot
+    key's expiry from fanning out into one heavy query per concurrent
+    request (a cache stampede).
+
+    Pass ``tag=False`` for version-stamped keys, which go stale via the
+    version bump and need no tag-set eviction.
+    """
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached, True
+
+    conn = None
+    got_lock = True
+    lock_key = None
+    try:
+        conn = get_redis_connection('default')
+        lock_key = cache.make_key(f'{cache_key}:lock')
+        got_lock = bool(conn.set(lock_key, '1', nx=True, ex=10))
+    except Exception:
+        # No raw Redis access (e.g. LocMem in tests): fall back to
+        # plain cache-aside without the lock
+        conn = None
+
+    if not got_lock:
+        for _ in range(10):
+            time.sleep(0.05)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached, True
+        # Lock holder is slow or died; compute rather than error out
+
+    try:
+        value = producer()
+        cache.set(cache_key, value, timeout)
+        if tag:
+            tag_property_cache_key(cache_key)
+        return value, False
+    finally:
+        if conn is not None and got_lock:
+            try:
+                conn.delete(lock_key)
+            except Exception:
+                pass
+
+
+# Stale-while-revalidate settings for the property list: entries are
+# served as fresh for PROPERTIES_LIST_FRESH seconds, then served stale
+# for another PROPERTIES_LIST_STALE seconds while one background thread
+# refreshes them, so readers never wait on the DB after the first fill.
+PROPERTIES_LIST_KEY = 'properties_list'
+PROPERTIES_LIST_FRESH = 300
+PROPERTIES_LIST_STALE = 120
+
+
+def _properties_list_key():
+    # Version-stamped so a write retires the key with one INCR instead
+    # of a DELETE; the orphaned old version ages out via its TTL
+    return f'{PROPERTIES_LIST_KEY}:v{get_properties_version()}'
+
+# Columns the list template actually renders. Property has no FK/M2M to
+# select_related, so trimming unused columns (amenity flags, timestamps,
+# reference_number, square_feet) is the available fetch optimization.
+# description must stay in the list: short_description slices it, and a
+# deferred field would trigger one extra query per rendered row — the
+# same N+1 this trimming is meant to avoid.
+PROPERTY_LIST_FIELDS = (
+    'id', 'title', 'description', 'price', 'location', 'property_type',
+    'bedrooms', 'bathrooms_halves', 'status', 'created_at',
+)
+
+
+# Fields orjson serializes via default=str that need their Python type
+# back when a row is rebuilt into a model instance.
+_PROPERTY_DATETIME_FIELDS = ('created_at', 'updated_at', 'listed_date')
+
+
+def _property_from_row(row):
+    """
+    Rebuild a Property instance from a cached dict row.
+
+    Rows come out of orjson with datetimes and Decimals downgraded to
+    strings (default=str), so restore those before instantiating.
+    """
+    row = dict(row)
+    for field in _PROPERTY_DATETIME_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            row[field] = datetime.fromisoformat(value)
+    if isinstance(row.get('price'), str):
+        row['price'] = Decimal(row['price'])
+
+    obj = Property(**row)
+    # Mark as loaded-from-db so a later save() UPDATEs instead of INSERTs
+    obj._state.adding = False
+    obj._state.db = 'default'
+    return obj
+
+
+def _build_properties_list_entry():
+    # Rows come from the per-property hash store, which the write
+    # signals keep current with O(1) HSET+ZADD per save — a rebuild
+    # here only reaches the DB when the store itself is cold. Plain
+    # dict rows serialized with orjson, never pickled instances: a
+    # pickled QuerySet stores only the query and re-runs its SQL when
+    # iterated, and pickle deserialization both costs more CPU and
+    # executes arbitrary opcodes if Redis were ever compromised
+    from .utils import get_all_properties
+
+    now = time.time()
+    rows = [row for row in get_all_properties() if row.get('status') == 'available']
+    return orjson.dumps({
+        'data': rows,
+        'fresh_until': now + PROPERTIES_LIST_FRESH,
+        'stale_until': now + PROPERTIES_LIST_FRESH + PROPERTIES_LIST_STALE,
+    }, default=str)
+
+
+def _refresh_properties_list():
+    """Background refresh for the SWR entry; at most one per expiry."""
+    list_key = _properties_list_key()
+    try:
+        conn = get_redis_connection('default')
+        refresh_lock = cache.make_key(f'{list_key}:refresh')
+        if not conn.set(refresh_lock, '1', nx=True, ex=30):
+            return  # another worker is already refreshing
+    except Exception:
+        pass
+
+    try:
+        payload = _build_properties_list_entry()
+        cache.set(
+            list_key,
+            payload,
+            PROPERTIES_LIST_FRESH + PROPERTIES_LIST_STALE,
+        )
+    except Exception:
+        # Stale data keeps being served until the entry's TTL runs out
+        logger.warning("Background property list refresh failed", exc_info=True)
+
+
+def _get_property_versions(ids):
+    """
+    Fetch the cache version for several properties in one MGET.
+
+    Saves/deletes bump property_ver:{pk} with one INCR, so stale
+    per-object entries become unreachable and expire via TTL instead
+    of needing pattern deletes.
+
+    A missing key reads as version 0, because INCR creates a missing
+    key *at* 1 — defaulting to 1 here would make the first bump of a
+    property land on the same version the reader already used, serving
+    the stale entry for its full TTL.
+    """
+    try:
+        conn = get_redis_connection('default')
+        raw = conn.mget([cache.make_key(property_version_key(i)) for i in ids])
+        return {i: int(v or 0) for i, v in zip(ids, raw)}
+    except Exception:
+        return {i: 0 for i in ids}
+
+
+def get_properties_bulk(ids):
+    """
+    Fetch many properties with batched cache round trips.
+
+    One get_many covers every versioned key, one DB query covers the
+    misses and one set_many writes them back, so the Redis RTT count
+    stays constant instead of growing with len(ids).
+
+    Args:
+        ids: Iterable of property primary keys
+
+    Returns:
+        list: Property instances in input order; None for unknown ids
+    """
+    ids = list(ids)
+    versions = _get_property_versions(ids)
+    keys = {i: f'property_{i}_v{versions[i]}' for i in ids}
+
+    hit = cache.get_many(list(keys.values()))
+
+    missing = [i for i in ids if keys[i] not in hit]
+    fetched = {}
+    if missing:
+        # Cache orjson dict rows, not pickled instances (see
+        # _property_from_row for the rebuild)
+        fetched = {
+            row['id']: row
+            for row in Property.objects.filter(id__in=missing).values()
+        }
+        cache.set_many(
+            {keys[i]: orjson.dumps(row, default=str) for i, row in fetched.items()},
+            60 * 15,  # Cache for 15 minutes
+        )
+        for i in fetched:
+            tag_property_cache_key(keys[i])
+
+    results = []
+    for i in ids:
+        payload = hit.get(keys[i])
+        if payload is not None:
+            results.append(_property_from_row(orjson.loads(payload)))
+        elif i in fetched:
+            results.append(_property_from_row(fetched[i]))
+        else:
+            results.append(None)
+    return results
+
+
+def _properties_version():
+    """
+    Version stamp for the {% cache %} fragment in property_list.html.
+
+    Uses the same properties:version counter as the list keys: the
+    write signals INCR it, making stale rendered fragments unreachable
+    immediately instead of waiting out their TTL.
+    """
+    return get_properties_version()
+
 
 class PropertyDetailView(DetailView):
     model = Property
     template_name = 'properties/property_detail.html'
     context_object_name = 'property'
-    
-    @method_decorator(cache_page(60 * 15))  # Cache for 15 minutes
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
-    
+
+    # No cache_page on dispatch: it keys on the URL alone with no
+    # invalidation hook, so an edit stayed invisible for the full TTL
+    # regardless of the versioned object cache underneath. get() below
+    # folds the per-object version into the response key instead — a
+    # save INCRs property_ver:{pk}, the next hit builds a key no writer
+    # has populated, and the stale bytes age out via TTL.
+
+    def get(self, request, *args, **kwargs):
+        pk = self.kwargs.get('pk')
+        version = _get_property_versions([pk])[pk]
+        response_key = f'pdetail:{pk}:v{version}'
+
+        content = cache.get(response_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        cache.set(response_key, response.content, 60 * 15)
+        return response
+
     def get_object(self, queryset=None):
         property_id = self.kwargs.get('pk')
-        cache_key = f'property_{property_id}'
-        cached_property = cache.get(cache_key)
-        
-        if cached_property is not None:
-            return cached_property
-        
-        property_obj = super().get_object(queryset)
-        cache.set(cache_key, property_obj, 60 * 15)  # Cache for 15 minutes
+
+        property_obj = get_properties_bulk([property_id])[0]
+        if property_obj is None:
+            raise Http404(f"No property found matching id {property_id}")
         return property_obj
-    # properties/views.py
 
 
 # Function-based view with cache_page decorator
@@ -71,19 +322,33 @@ def property_list_view(request):
     """
     Function-based property list view with caching
     """
-    properties = Property.objects.all().order_by('-created_at')
-    
-    # Log cache hit/miss (for debugging)
-    logger.info(f"Property list view accessed - Cache key: {request.path}")
+    properties = Property.objects.only(*PROPERTY_LIST_FIELDS).order_by('-created_at')
+
+    # Lazy % args: no string formatting happens unless DEBUG is emitted
+    logger.debug("Property list view accessed - Cache key: %s", request.path)
     
     return render(request, 'properties/property_list.html', {
         'properties': properties,
         'view_type': 'Function-based view',
-        'cache_time': '15 minutes'
+        'cache_time': '15 minutes',
+        'properties_version': _properties_version(),
     })
 
 
-# Class-based view with cache_page decorator
+def _list_etag(request, *args, **kwargs):
+    """
+    ETag for the property list: the global version counter.
+
+    The write signals INCR properties:version, so any change produces a
+    new ETag; unchanged repeat visits get a 304 with an empty body for
+    the cost of one Redis GET. Validation is per-URL, so every page
+    sharing the stamp is fine.
+    """
+    return str(get_properties_version())
+
+
+# Class-based view with stale-while-revalidate caching
+@method_decorator(condition(etag_func=_list_etag), name='dispatch')
 class PropertyListView(ListView):
     """
     Class-based property list view with caching
@@ -92,24 +357,72 @@ class PropertyListView(ListView):
     template_name = 'properties/property_list.html'
     context_object_name = 'properties'
     paginate_by = 10
-    
-    @method_decorator(cache_page(60 * 15))  # Cache for 15 minutes
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
-    
+
+    # No cache_page on dispatch: cache_page keys on the full URL plus
+    # Vary headers, so session cookies fan one page out into an entry
+    # per visitor and invalidation can only flush everything. get()
+    # below caches response bytes keyed by page number alone, and the
+    # keys are tagged so write signals evict exactly the list pages.
+
+    def get(self, request, *args, **kwargs):
+        page = request.GET.get('page', '1')
+        # Version-stamped: a write INCRs the version, so no DELETE ever
+        # targets these keys and old pages age out via TTL
+        response_key = f'plist:v{get_properties_version()}:page={page}'
+
+        content = cache.get(response_key)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        cache.set(response_key, response.content, 900)
+        return response
+
     def get_queryset(self):
-        # Order by newest first
-        return Property.objects.all().order_by('-created_at')
-    
+        list_key = _properties_list_key()
+        payload = cache.get(list_key)
+
+        if payload is None:
+            # Cold or fully expired: populate synchronously (single-flight)
+            payload, _ = get_or_populate_cache(
+                list_key,
+                _build_properties_list_entry,
+                PROPERTIES_LIST_FRESH + PROPERTIES_LIST_STALE,
+                tag=False,
+            )
+            entry = orjson.loads(payload)
+        else:
+            entry = orjson.loads(payload)
+            if time.time() >= entry['fresh_until']:
+                # Stale window: serve immediately, refresh off-request
+                _run_in_background(_refresh_properties_list)
+
+        return [_property_from_row(row) for row in entry['data']]
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Add additional context
         context['view_type'] = 'Class-based view'
-        context['cache_time'] = '15 minutes'
-        context['total_properties'] = Property.objects.count()
-        
+        context['cache_time'] = '5 minutes'
+        context['total_properties'] = get_total_properties()
+        context['properties_version'] = _properties_version()
+
+        # Inter-action prefetch: the ids a visitor can click next are
+        # known now, so warm their detail-cache entries off-request.
+        # get_properties_bulk fills every miss with one DB query and one
+        # set_many, turning the first detail click into a Redis hit.
+        page_obj = context.get('page_obj')
+        visible = page_obj.object_list if page_obj is not None else context['properties']
+        visible_ids = [prop.id for prop in visible]
+        if visible_ids:
+            _run_in_background(get_properties_bulk, visible_ids)
+
         # Log for debugging
-        logger.info(f"Class-based property list view - Total: {context['total_properties']}")
+        logger.debug(
+            "Class-based property list view - Total: %s",
+            context['total_properties'],
+        )
         
         return context
 
@@ -120,89 +433,90 @@ def property_list_advanced(request):
     Advanced property list view with manual Redis cache control
     """
     cache_key = 'property_list_advanced'
-    
-    # Try to get from cache
-    cached_data = cache.get(cache_key)
-    
-    if cached_data is not None:
-        logger.info(f"Cache HIT for key: {cache_key}")
-        properties, context_data = cached_data
-        
+
+    def _build():
+        properties = Property.objects.only(*PROPERTY_LIST_FIELDS).order_by('-created_at')
+        context_data = {
+            'properties': properties,
+            'view_type': 'Advanced view with manual caching',
+            'cache_time': '15 minutes',
+            'cache_hit': False,
+            'total_properties': get_total_properties(),
+            'properties_version': _properties_version(),
+        }
+        return (properties, context_data)
+
+    # Store in cache for 15 minutes (900 seconds); the single-flight
+    # lock inside get_or_populate_cache makes sure only one worker runs
+    # _build when the key expires under load
+    (properties, context_data), cache_hit = get_or_populate_cache(
+        cache_key, _build, 60 * 15
+    )
+
+    if cache_hit:
+        logger.debug("Cache HIT for key: %s", cache_key)
         # Add cache indicator to context
         context_data['cache_hit'] = True
         context_data['cached_at'] = cache.ttl(cache_key)  # Time remaining in seconds
-        return render(request, 'properties/property_list.html', context_data)
-    
-    logger.info(f"Cache MISS for key: {cache_key}")
-    
-    # Cache miss - fetch from database
-    properties = Property.objects.all().order_by('-created_at')
-    
-    # Prepare context
-    context_data = {
-        'properties': properties,
-        'view_type': 'Advanced view with manual caching',
-        'cache_time': '15 minutes',
-        'cache_hit': False,
-        'total_properties': Property.objects.count(),
-    }
-    
-    # Store in cache for 15 minutes (900 seconds)
-    cache.set(cache_key, (properties, context_data), timeout=60 * 15)
-    
+    else:
+        logger.debug("Cache MISS for key: %s", cache_key)
+
     return render(request, 'properties/property_list.html', context_data)
 
 
 # create monitoring view
 def cache_monitor(request):
     """
-    View to monitor cache invalidation signals.
+    View to monitor cache invalidation signals (HTML).
     """
     stats = get_cache_invalidation_stats()
-    
-    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        # Return JSON for AJAX requests
-        return JsonResponse(stats)
-    
-    # Return HTML for browser requests
+
     context = {
         'stats': stats,
-        'total_properties': Property.objects.count(),
-        'cache_working': cache.get('all_properties') is not None,
+        'total_properties': get_total_properties(),
+        'cache_working': stats['current_cache_state']['all_properties_cached'],
     }
     
     return render(request, 'properties/cache_monitor.html', context)
 
+
+def cache_monitor_json(request):
+    """
+    API endpoint for cache invalidation stats (JSON format).
+
+    Routed separately from cache_monitor so the JSON path never builds
+    template context and no per-request header sniffing is needed.
+    """
+    return JsonResponse(get_cache_invalidation_stats())
+
+from properties.metrics_bg import load_cache_metrics
 from properties.utils import (
-    get_redis_cache_metrics, 
-    get_cache_metrics_trend,
+    get_total_properties,
     reset_cache_metrics,
-    get_detailed_cache_analysis
 )
 import json
 from django.views.decorators.cache import never_cache
-#  comment here
+
+# The dashboard views below read a snapshot that a background thread
+# recomputes every 30s (see metrics_bg), so request-time cost is a dict
+# lookup and Redis INFO traffic stays flat no matter how often the
+# dashboards poll. @never_cache still keeps the HTTP layer honest.
 @never_cache
 def cache_metrics_view(request):
     """
     View to display Redis cache metrics.
     """
-    metrics = get_redis_cache_metrics()
-    trend = get_cache_metrics_trend()
-    
+    snapshot = load_cache_metrics()
+    metrics = snapshot['metrics']
+    trend = snapshot['trend']
+
     context = {
         'metrics': metrics,
         'trend': trend,
         'page_title': 'Redis Cache Metrics',
         'refresh_interval': 30,  # seconds
     }
-    
-    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        return JsonResponse({
-            'metrics': metrics,
-            'trend': trend,
-        })
-    
+
     return render(request, 'properties/cache_metrics.html', context)
 
 
@@ -211,28 +525,33 @@ def cache_metrics_json(request):
     """
     API endpoint for cache metrics (JSON format).
     """
-    metrics = get_redis_cache_metrics()
+    metrics = load_cache_metrics()['metrics']
     return JsonResponse(metrics)
 
 
 @never_cache
 def cache_analysis_view(request):
     """
-    Detailed cache analysis view.
+    Detailed cache analysis view (HTML).
     """
-    analysis = get_detailed_cache_analysis()
-    
+    analysis = load_cache_metrics()['analysis']
+
     context = {
         'analysis': analysis,
         'page_title': 'Cache Performance Analysis',
     }
-    
-    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        return JsonResponse(analysis)
-    
+
     return render(request, 'properties/cache_analysis.html', context)
 
 
+@never_cache
+def cache_analysis_json(request):
+    """
+    API endpoint for the cache analysis (JSON format).
+    """
+    return JsonResponse(load_cache_metrics()['analysis'])
+
+
 @never_cache
 def reset_metrics_view(request):
     """
@@ -258,7 +577,8 @@ class CacheMetricsDashboard(TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['metrics'] = get_redis_cache_metrics()
-        context['trend'] = get_cache_metrics_trend()
+        snapshot = load_cache_metrics()
+        context['metrics'] = snapshot['metrics']
+        context['trend'] = snapshot['trend']
         context['page_title'] = 'Cache Metrics Dashboard'
         return context
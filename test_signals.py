@@ -2,7 +2,6 @@
 import os
 import sys
 import django
-import time
 from datetime import datetime
 
 # Setup Django
@@ -11,8 +10,13 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'alx_backend_caching_property_li
 django.setup()
 
 from properties.models import Property
+from properties.signals import (
+    invalidate_bulk_write_caches,
+    property_in_index,
+    property_index_size,
+)
 from properties.utils import get_all_properties
-from django.core.cache import cache
+from django.db import transaction
 from decimal import Decimal
 
 def test_cache_invalidation_signals():
@@ -25,64 +29,63 @@ def test_cache_invalidation_signals():
     
     # Clear cache before starting
     print("\n🗑️  Step 1: Clearing initial cache...")
-    cache.delete('all_properties')
+    invalidate_bulk_write_caches()
     print("   ✅ Cache cleared")
-    
-    # Step 2: Populate cache
+
+    # Step 2: Populate cache (hash store + index)
     print("\n📝 Step 2: Populating cache...")
     properties = get_all_properties()
     print(f"   ✅ Retrieved {len(properties)} properties")
-    print(f"   Cache populated: {cache.get('all_properties') is not None}")
-    
-    # Step 3: Create a new property (should invalidate cache)
+    print(f"   Properties indexed in cache: {property_index_size()}")
+
+    # Step 3: Create a new property. The list cache is write-through:
+    # the signal writes the new row into the hash store rather than
+    # dropping it. Signals are synchronous; the cache work is deferred
+    # only until commit, so atomic blocks make it observable
+    # immediately after — no sleeps needed.
     print("\n➕ Step 3: Creating new property...")
-    new_property = Property.objects.create(
-        title="Test Property - Signal Test",
-        description="Testing cache invalidation signals",
-        price=Decimal('250000'),
-        location="Test City, TS",
-        property_type="house",
-        bedrooms=3,
-        bathrooms=2.0,
-    )
+    with transaction.atomic():
+        new_property = Property.objects.create(
+            title="Test Property - Signal Test",
+            description="Testing cache invalidation signals",
+            price=Decimal('250000'),
+            location="Test City, TS",
+            property_type="house",
+            bedrooms=3,
+            bathrooms=2.0,
+        )
     print(f"   ✅ Created property: {new_property.title}")
-    
-    # Wait a moment for signals to process
-    time.sleep(0.5)
-    
-    # Check if cache was invalidated
+
+    # Check that the new row was written through to the cache
     print("\n🔍 Step 4: Checking cache after creation...")
-    cached = cache.get('all_properties') is not None
-    print(f"   Cache after creation: {'STILL CACHED' if cached else 'INVALIDATED'}")
-    
-    if cached:
-        print("   ⚠️  Cache should have been invalidated by post_save signal")
+    indexed = property_in_index(new_property.id)
+    print(f"   New property in cache index: {indexed}")
+
+    if indexed:
+        print("   ✅ post_save signal wrote the row through to the cache!")
     else:
-        print("   ✅ Cache successfully invalidated by signal!")
+        print("   ⚠️  post_save signal should have written the row through")
     
     # Step 5: Update property
     print("\n✏️  Step 5: Updating property...")
-    new_property.title = "Test Property - Updated"
-    new_property.save()
+    with transaction.atomic():
+        new_property.title = "Test Property - Updated"
+        new_property.save()
     print(f"   ✅ Updated property title")
-    
-    time.sleep(0.5)
-    
+
     print("\n🔍 Step 6: Checking cache after update...")
-    cached = cache.get('all_properties') is not None
-    print(f"   Cache after update: {'STILL CACHED' if cached else 'INVALIDATED'}")
+    print(f"   Updated property still in cache index: {property_in_index(new_property.id)}")
     
     # Step 7: Delete property
     print("\n🗑️  Step 7: Deleting property...")
     property_id = new_property.id
-    new_property.delete()
+    with transaction.atomic():
+        new_property.delete()
     print(f"   ✅ Deleted property ID: {property_id}")
-    
-    time.sleep(0.5)
-    
+
     print("\n🔍 Step 8: Checking cache after deletion...")
-    cached = cache.get('all_properties') is not None
-    print(f"   Cache after deletion: {'STILL CACHED' if cached else 'INVALIDATED'}")
+    removed = not property_in_index(property_id)
+    print(f"   Deleted property removed from cache index: {removed}")
     
     # Step 9: Test cache statistics
     print("\n📊 Step 9: Checking cache invalidation statistics...")
@@ -102,7 +105,7 @@ def test_cache_invalidation_signals():
     # Summary
     print("\n📋 Summary:")
     print(f"   Properties in database: {Property.objects.count()}")
-    print(f"   Cache populated: {cache.get('all_properties') is not None}")
+    print(f"   Properties indexed in cache: {property_index_size()}")
     print(f"   Total cache invalidations recorded: {stats['total_invalidations']}")
 
 def test_bulk_operations():
@@ -113,9 +116,9 @@ def test_bulk_operations():
     print("Testing Bulk Operations with Cache Invalidation")
     print("=" * 70)
     
-    # Clear cache
-    cache.delete('all_properties')
-    
+    # Warm the cache so the bulk invalidation is observable
+    get_all_properties()
+
     # Create multiple properties
     print("\n📝 Creating multiple properties...")
     properties_to_create = []
@@ -132,15 +135,17 @@ def test_bulk_operations():
         )
         properties_to_create.append(prop)
     
-    # Use individual saves (each triggers signal)
-    print("\n💾 Saving individually (each triggers signal)...")
-    for prop in properties_to_create:
-        prop.save()
-    
-    time.sleep(1)
-    
-    print(f"   Created {len(properties_to_create)} properties individually")
-    print(f"   Cache after individual saves: {'INVALIDATED' if cache.get('all_properties') is None else 'CACHED'}")
+    # One bulk_create in one transaction instead of N individual saves:
+    # N round trips and N signal-driven invalidations become a single
+    # INSERT. bulk_create skips post_save, so the model helper drops
+    # the hash-store index once for the whole batch.
+    print("\n💾 Saving with bulk_create (single INSERT, one invalidation)...")
+    with transaction.atomic():
+        Property.bulk_create_with_cache_invalidation(properties_to_create, batch_size=500)
+
+    print(f"   Created {len(properties_to_create)} properties in one batch")
+    dropped = property_index_size() == 0
+    print(f"   Cache index after bulk create: {'DROPPED FOR REBUILD' if dropped else 'STILL POPULATED'}")
     
     # Clean up
     print("\n🗑️  Cleaning up test properties...")